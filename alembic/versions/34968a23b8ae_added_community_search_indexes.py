@@ -0,0 +1,45 @@
+"""Added community search indexes
+
+Revision ID: 34968a23b8ae
+Revises: 6c46d81298d4
+Create Date: 2026-10-15 10:04:17.552930
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "34968a23b8ae"
+down_revision: Union[str, Sequence[str], None] = "6c46d81298d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_community_name_trgm",
+        "community",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_community_description_trgm",
+        "community",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_community_description_trgm", table_name="community")
+    op.drop_index("ix_community_name_trgm", table_name="community")
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
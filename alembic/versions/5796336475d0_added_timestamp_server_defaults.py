@@ -0,0 +1,45 @@
+"""Added timestamp server defaults
+
+Revision ID: 5796336475d0
+Revises: 34968a23b8ae
+Create Date: 2026-10-15 11:26:53.804417
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5796336475d0"
+down_revision: Union[str, Sequence[str], None] = "34968a23b8ae"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ("community", "event"):
+        for column in ("created_at", "updated_at"):
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=sa.text("now()"),
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ("community", "event"):
+        for column in ("created_at", "updated_at"):
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=None,
+            )
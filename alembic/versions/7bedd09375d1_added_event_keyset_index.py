@@ -0,0 +1,31 @@
+"""Added event keyset index
+
+Revision ID: 7bedd09375d1
+Revises: f8ad0c2aedf3
+Create Date: 2026-10-15 18:21:44.907153
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7bedd09375d1"
+down_revision: Union[str, Sequence[str], None] = "f8ad0c2aedf3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_event_start_time_id", "event", ["start_time", "id"], unique=False
+    )
+    op.drop_index("ix_event_start_time", table_name="event")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_event_start_time", "event", ["start_time"], unique=False)
+    op.drop_index("ix_event_start_time_id", table_name="event")
@@ -0,0 +1,44 @@
+"""Added lowercase event search index
+
+Revision ID: 959ff97c55d6
+Revises: f1b8139003e7
+Create Date: 2026-10-15 15:03:51.274810
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "959ff97c55d6"
+down_revision: Union[str, Sequence[str], None] = "f1b8139003e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_event_search_text_lower_trgm",
+        "event",
+        [sa.text("lower(search_text) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.drop_index("ix_event_search_text_trgm", table_name="event")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_event_search_text_trgm",
+        "event",
+        ["search_text"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+    op.drop_index("ix_event_search_text_lower_trgm", table_name="event")
@@ -0,0 +1,53 @@
+"""Extended event listing indexes with id
+
+Revision ID: ba2a6ada0882
+Revises: 7bedd09375d1
+Create Date: 2026-10-15 19:04:37.662810
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ba2a6ada0882"
+down_revision: Union[str, Sequence[str], None] = "7bedd09375d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("ix_event_community_start", table_name="event")
+    op.create_index(
+        "ix_event_community_start",
+        "event",
+        ["community_id", "start_time", "id"],
+        unique=False,
+    )
+    op.drop_index("ix_event_active_public_start", table_name="event")
+    op.create_index(
+        "ix_event_active_public_start",
+        "event",
+        ["is_active", "is_public", "start_time", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_event_active_public_start", table_name="event")
+    op.create_index(
+        "ix_event_active_public_start",
+        "event",
+        ["is_active", "is_public", "start_time"],
+        unique=False,
+    )
+    op.drop_index("ix_event_community_start", table_name="event")
+    op.create_index(
+        "ix_event_community_start",
+        "event",
+        ["community_id", "start_time"],
+        unique=False,
+    )
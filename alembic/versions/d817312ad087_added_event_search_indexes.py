@@ -0,0 +1,37 @@
+"""Added event search indexes
+
+Revision ID: d817312ad087
+Revises: 5796336475d0
+Create Date: 2026-10-15 13:41:08.127395
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d817312ad087"
+down_revision: Union[str, Sequence[str], None] = "5796336475d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm was enabled alongside the community search indexes
+    for column in ("title", "description", "location"):
+        op.create_index(
+            f"ix_event_{column}_trgm",
+            "event",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in ("location", "description", "title"):
+        op.drop_index(f"ix_event_{column}_trgm", table_name="event")
@@ -0,0 +1,62 @@
+"""Added event search_text column
+
+Revision ID: f1b8139003e7
+Revises: d817312ad087
+Create Date: 2026-10-15 14:22:36.690152
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1b8139003e7"
+down_revision: Union[str, Sequence[str], None] = "d817312ad087"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "event",
+        sa.Column(
+            "search_text",
+            sa.Text(),
+            sa.Computed(
+                "coalesce(title, '') || ' ' || coalesce(description, '') || ' ' "
+                "|| coalesce(location, '')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_event_search_text_trgm",
+        "event",
+        ["search_text"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+    # search_events no longer filters on the individual columns
+    for column in ("location", "description", "title"):
+        op.drop_index(f"ix_event_{column}_trgm", table_name="event")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in ("title", "description", "location"):
+        op.create_index(
+            f"ix_event_{column}_trgm",
+            "event",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+    op.drop_index("ix_event_search_text_trgm", table_name="event")
+    op.drop_column("event", "search_text")
@@ -0,0 +1,34 @@
+"""Added event start time indexes
+
+Revision ID: f8ad0c2aedf3
+Revises: 959ff97c55d6
+Create Date: 2026-10-15 17:52:06.214738
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f8ad0c2aedf3"
+down_revision: Union[str, Sequence[str], None] = "959ff97c55d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_event_creator_start",
+        "event",
+        ["created_by", "start_time"],
+        unique=False,
+    )
+    op.create_index("ix_event_start_time", "event", ["start_time"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_event_start_time", table_name="event")
+    op.drop_index("ix_event_creator_start", table_name="event")
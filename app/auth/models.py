@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 from pydantic import EmailStr
 from sqlmodel import Field, Relationship
 
-from app.database import NittySQLModel
+from app.database import NittySQLModel, uuid7
 
 if TYPE_CHECKING:
     from app.communities.models import Community
@@ -34,7 +34,7 @@ class UserUpdate(UserBase):
 
 
 class User(UserBase, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
     hashed_password: str
 
     # Relationships
@@ -52,7 +52,7 @@ class Token(NittySQLModel):
 
 
 class TokenPayload(NittySQLModel):
-    sub: str | None = None
+    sub: uuid.UUID | None = None
 
 
 # Rebuild models to resolve forward references
@@ -4,6 +4,7 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.exc import IntegrityError
 
 import app.auth.service as auth_service
 from app.auth.models import Token, UserCreate, UserPublic, UserRegister
@@ -25,7 +26,6 @@ def login_access_token(
     user = auth_service.authenticate(
         session=session, email=form_data.username, password=form_data.password
     )
-    logger.info(f"User: {user}")
     if not user:
         raise HTTPException(status_code=400, detail="Incorrect email or password")
     elif not user.is_active:
@@ -44,12 +44,14 @@ def register_user(session: DbSession, user_in: UserRegister) -> Any:
     """
     Create new user without the need to be logged in.
     """
-    user = auth_service.get_user_by_email(session=session, email=user_in.email)
-    if user:
+    user_create = UserCreate.model_validate(user_in)
+    # The unique index on email rejects duplicates, so no lookup is needed first
+    try:
+        user = auth_service.create_user(session=session, user_create=user_create)
+    except IntegrityError:
+        session.rollback()
         raise HTTPException(
             status_code=400,
             detail="The user with this email already exists in the system",
         )
-    user_create = UserCreate.model_validate(user_in)
-    user = auth_service.create_user(session=session, user_create=user_create)
     return user
@@ -1,9 +1,13 @@
+import base64
+import hashlib
+import hmac
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-import jwt
-from passlib.context import CryptContext
+import bcrypt
+import orjson
+from sqlalchemy import lambda_stmt
 from sqlmodel import Session, select
 
 from app.auth.models import User, UserCreate, UserUpdate
@@ -11,38 +15,52 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+ALGORITHM = "HS256"
 
 
-ALGORITHM = "HS256"
+def _base64url_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+# The JWT header and signing key never change, so encode them once rather
+# than on every login
+_JWT_HEADER = _base64url_encode(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+_JWT_KEY = settings.SECRET_KEY.encode()
 
 
 def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     expire = datetime.now(timezone.utc) + expires_delta
-    to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    to_encode = {"exp": int(expire.timestamp()), "sub": str(subject)}
+    signing_input = f"{_JWT_HEADER}.{_base64url_encode(orjson.dumps(to_encode))}"
+    signature = hmac.digest(_JWT_KEY, signing_input.encode(), hashlib.sha256)
+    return f"{signing_input}.{_base64url_encode(signature)}"
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    logger.info(
-        f"Verify password result: {pwd_context.verify(plain_password, hashed_password)}"
-    )
+    result = bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    logger.debug("Verify password result: %s", result)
 
-    return pwd_context.verify(plain_password, hashed_password)
+    return result
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode(), salt).decode()
+
+
+# Checked against when the email is unknown, so a failed login costs one bcrypt
+# either way and response time doesn't reveal which emails are registered
+_DUMMY_PASSWORD_HASH = get_password_hash("dummy-password")
 
 
 def create_user(*, session: Session, user_create: UserCreate) -> User:
-    db_obj = User.model_validate(
-        user_create, update={"hashed_password": get_password_hash(user_create.password)}
+    # user_create is already validated, and table models skip validation in __init__
+    db_obj = User(
+        **user_create.model_dump(exclude={"password"}),
+        hashed_password=get_password_hash(user_create.password),
     )
     session.add(db_obj)
     session.commit()
-    session.refresh(db_obj)
     return db_obj
 
 
@@ -56,29 +74,28 @@ def update_user(*, session: Session, db_user: User, user_in: UserUpdate) -> Any:
     db_user.sqlmodel_update(user_data, update=extra_data)
     session.add(db_user)
     session.commit()
-    session.refresh(db_user)
     return db_user
 
 
 def get_user_by_email(*, session: Session, email: str) -> User | None:
-    statement = select(User).where(User.email == email)
-    session_user = session.exec(statement).first()
+    statement = lambda_stmt(lambda: select(User).where(User.email == email))
+    session_user = session.exec(statement).scalars().first()
 
-    logger.info(f"User found: {session_user}")
+    logger.debug("User lookup for %s found: %s", email, session_user is not None)
 
     return session_user
 
 
 def authenticate(*, session: Session, email: str, password: str) -> User | None:
     db_user = get_user_by_email(session=session, email=email)
-    logger.info(f"Authenticating user: {db_user}")
 
     if not db_user:
-        logger.info(f"User not found: {email}")
+        verify_password(password, _DUMMY_PASSWORD_HASH)
+        logger.info("User not found: %s", email)
         return None
 
     if not verify_password(password, db_user.hashed_password):
-        logger.info(f"Password verification failed for user: {db_user}")
+        logger.info("Password verification failed for user: %s", db_user.id)
         return None
 
     return db_user
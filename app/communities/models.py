@@ -2,9 +2,10 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Column, DateTime, Index, func
 from sqlmodel import Field, Relationship
 
-from app.database import NittySQLModel
+from app.database import NittySQLModel, uuid7
 
 if TYPE_CHECKING:
     from app.auth.models import User
@@ -30,9 +31,35 @@ class CommunityUpdate(NittySQLModel):
 
 
 class Community(CommunityBase, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_community_active_public", "is_active", "is_public"),
+        # Trigram indexes back the ILIKE '%q%' predicates in search_communities
+        Index(
+            "ix_community_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_community_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
+
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(), nullable=False, server_default=func.now()),
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(), nullable=False, server_default=func.now(), onupdate=func.now()
+        ),
+    )
     created_by: uuid.UUID = Field(foreign_key="user.id")
 
     # Relationships
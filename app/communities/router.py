@@ -1,27 +1,42 @@
 import logging
-from typing import Annotated, Any, List, Optional
+from typing import Any, List, Optional, Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from fastapi.security import HTTPBearer
+from pydantic import TypeAdapter
 
 import app.communities.service as community_service
-from app.auth.models import User
-from app.communities.models import CommunityCreate, CommunityPublic, CommunityUpdate
+from app.communities.models import (
+    Community,
+    CommunityCreate,
+    CommunityPublic,
+    CommunityUpdate,
+)
 from app.database import DbSession
-from app.deps import get_current_user
+from app.deps import CurrentUser
 
 logger = logging.getLogger(__name__)
 
 communities_router = APIRouter(tags=["communities"])
 security = HTTPBearer()
 
+_communities_adapter = TypeAdapter(list[CommunityPublic])
+
+
+def _list_response(communities: Sequence[Community]) -> Response:
+    """Validate and encode a page of communities straight to JSON bytes."""
+    public = _communities_adapter.validate_python(communities, from_attributes=True)
+    return Response(
+        _communities_adapter.dump_json(public), media_type="application/json"
+    )
+
 
 @communities_router.post("/", response_model=CommunityPublic)
 def create_community(
     session: DbSession,
     community_in: CommunityCreate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: CurrentUser,
 ) -> Any:
     """Create a new community."""
     community = community_service.create_community(
@@ -46,7 +61,7 @@ def get_communities(
         is_public=is_public,
         is_active=is_active,
     )
-    return communities
+    return _list_response(communities)
 
 
 @communities_router.get("/search", response_model=List[CommunityPublic])
@@ -60,13 +75,13 @@ def search_communities(
     communities = community_service.search_communities(
         session=session, query=q, skip=skip, limit=limit
     )
-    return communities
+    return _list_response(communities)
 
 
 @communities_router.get("/my", response_model=List[CommunityPublic])
 def get_my_communities(
     session: DbSession,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: CurrentUser,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
 ) -> Any:
@@ -74,7 +89,7 @@ def get_my_communities(
     communities = community_service.get_communities_by_creator(
         session=session, created_by=current_user.id, skip=skip, limit=limit
     )
-    return communities
+    return _list_response(communities)
 
 
 @communities_router.get("/{community_id}", response_model=CommunityPublic)
@@ -96,7 +111,7 @@ def update_community(
     session: DbSession,
     community_id: UUID,
     community_in: CommunityUpdate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: CurrentUser,
 ) -> Any:
     """Update a community."""
     community = community_service.get_community(
@@ -119,7 +134,7 @@ def update_community(
 def delete_community(
     session: DbSession,
     community_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: CurrentUser,
 ) -> Any:
     """Delete a community (soft delete)."""
     community = community_service.get_community(
@@ -132,11 +147,7 @@ def delete_community(
     if community.created_by != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
-    success = community_service.delete_community(
-        session=session, community_id=community_id
-    )
-    if not success:
-        raise HTTPException(status_code=400, detail="Failed to delete community")
+    community_service.delete_community(session=session, db_community=community)
 
     return {"message": "Community deleted successfully"}
 
@@ -145,7 +156,7 @@ def delete_community(
 def permanently_delete_community(
     session: DbSession,
     community_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: CurrentUser,
 ) -> Any:
     """Permanently delete a community from the database."""
     community = community_service.get_community(
@@ -158,12 +169,6 @@ def permanently_delete_community(
     if community.created_by != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
-    success = community_service.hard_delete_community(
-        session=session, community_id=community_id
-    )
-    if not success:
-        raise HTTPException(
-            status_code=400, detail="Failed to permanently delete community"
-        )
+    community_service.hard_delete_community(session=session, db_community=community)
 
     return {"message": "Community permanently deleted"}
@@ -1,11 +1,13 @@
 import logging
-from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import lambda_stmt
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
 from app.communities.models import Community, CommunityCreate, CommunityUpdate
+from app.database import MAX_PAGE_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -14,21 +16,18 @@ def create_community(
     *, session: Session, community_create: CommunityCreate, created_by: UUID
 ) -> Community:
     """Create a new community."""
-    db_obj = Community.model_validate(
-        community_create, update={"created_by": created_by}
-    )
+    # Construct directly rather than re-validating community_create
+    db_obj = Community(**community_create.model_dump(), created_by=created_by)
     session.add(db_obj)
     session.commit()
-    session.refresh(db_obj)
-    logger.info(f"Created community: {db_obj.id}")
+    logger.info("Created community: %s", db_obj.id)
     return db_obj
 
 
 def get_community(*, session: Session, community_id: UUID) -> Optional[Community]:
     """Get a community by ID."""
-    statement = select(Community).where(Community.id == community_id)
-    community = session.exec(statement).first()
-    logger.info(f"Retrieved community: {community}")
+    community = session.get(Community, community_id)
+    logger.debug("Retrieved community: %s", community_id)
     return community
 
 
@@ -39,19 +38,28 @@ def get_communities(
     limit: int = 100,
     is_public: Optional[bool] = None,
     is_active: Optional[bool] = None,
+    with_creator: bool = False,
 ) -> List[Community]:
-    """Get communities with optional filtering."""
-    statement = select(Community)
+    """Get communities with optional filtering.
+
+    Pass ``with_creator=True`` when the creator will be read so it is
+    batch-loaded up front.
+    """
+    limit = min(limit, MAX_PAGE_SIZE)
+    statement = lambda_stmt(lambda: select(Community))
+
+    if with_creator:
+        statement += lambda s: s.options(selectinload(Community.creator))
 
     if is_public is not None:
-        statement = statement.where(Community.is_public == is_public)
+        statement += lambda s: s.where(Community.is_public == is_public)
 
     if is_active is not None:
-        statement = statement.where(Community.is_active == is_active)
+        statement += lambda s: s.where(Community.is_active == is_active)
 
-    statement = statement.offset(skip).limit(limit)
-    communities = session.exec(statement).all()
-    logger.info(f"Retrieved {len(communities)} communities")
+    statement += lambda s: s.offset(skip).limit(limit)
+    communities = session.exec(statement).scalars().all()
+    logger.debug("Retrieved %d communities", len(communities))
     return communities
 
 
@@ -59,10 +67,11 @@ def get_communities_by_creator(
     *, session: Session, created_by: UUID, skip: int = 0, limit: int = 100
 ) -> List[Community]:
     """Get communities created by a specific user."""
+    limit = min(limit, MAX_PAGE_SIZE)
     statement = select(Community).where(Community.created_by == created_by)
     statement = statement.offset(skip).limit(limit)
     communities = session.exec(statement).all()
-    logger.info(f"Retrieved {len(communities)} communities for user {created_by}")
+    logger.debug("Retrieved %d communities for user %s", len(communities), created_by)
     return communities
 
 
@@ -71,51 +80,39 @@ def update_community(
 ) -> Community:
     """Update a community."""
     community_data = community_in.model_dump(exclude_unset=True)
-    community_data["updated_at"] = datetime.utcnow()
 
     db_community.sqlmodel_update(community_data)
     session.add(db_community)
     session.commit()
-    session.refresh(db_community)
-    logger.info(f"Updated community: {db_community.id}")
+    logger.info("Updated community: %s", db_community.id)
     return db_community
 
 
-def delete_community(*, session: Session, community_id: UUID) -> bool:
+def delete_community(*, session: Session, db_community: Community) -> None:
     """Delete a community (soft delete by setting is_active=False)."""
-    community = get_community(session=session, community_id=community_id)
-    if not community:
-        return False
-
-    community.is_active = False
-    community.updated_at = datetime.utcnow()
-    session.add(community)
+    db_community.is_active = False
+    session.add(db_community)
     session.commit()
-    logger.info(f"Soft deleted community: {community_id}")
-    return True
+    logger.info("Soft deleted community: %s", db_community.id)
 
 
-def hard_delete_community(*, session: Session, community_id: UUID) -> bool:
+def hard_delete_community(*, session: Session, db_community: Community) -> None:
     """Permanently delete a community from the database."""
-    community = get_community(session=session, community_id=community_id)
-    if not community:
-        return False
-
-    session.delete(community)
+    session.delete(db_community)
     session.commit()
-    logger.info(f"Hard deleted community: {community_id}")
-    return True
+    logger.info("Hard deleted community: %s", db_community.id)
 
 
 def search_communities(
     *, session: Session, query: str, skip: int = 0, limit: int = 100
 ) -> List[Community]:
     """Search communities by name or description."""
+    limit = min(limit, MAX_PAGE_SIZE)
     statement = select(Community).where(
         (Community.name.ilike(f"%{query}%"))
         | (Community.description.ilike(f"%{query}%"))
     )
     statement = statement.offset(skip).limit(limit)
     communities = session.exec(statement).all()
-    logger.info(f"Found {len(communities)} communities matching query: {query}")
+    logger.debug("Found %d communities matching query: %s", len(communities), query)
     return communities
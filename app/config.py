@@ -20,13 +20,26 @@ class Settings(BaseSettings):
     # 60 minutes * 24 hours * 8 days = 8 days
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
 
+    # Work factor for password hashes, 2^BCRYPT_ROUNDS Blowfish key expansions
+    BCRYPT_ROUNDS: int = 12
+
+    # Seconds a cached event read may lag behind writes made by other workers.
+    # 0 turns the per-process event caches off.
+    EVENT_CACHE_TTL: int = 0
+
     ENVIRONMENT: Literal["local", "staging", "production"] = "local"
 
     DATABASE_ENGINE_POOL_TIMEOUT: int = 30
-    DATABASE_ENGINE_POOL_RECYCLE: int = 3600
+    DATABASE_ENGINE_POOL_RECYCLE: int = 1800
+    # Per worker process: the Dockerfile's 4 workers open at most
+    # 4 * (10 + 10) = 80 connections, under Postgres' default
+    # max_connections of 100. Request threads beyond that wait up to
+    # DATABASE_ENGINE_POOL_TIMEOUT for a free connection.
     DATABASE_ENGINE_POOL_SIZE: int = 10
-    DATABASE_ENGINE_MAX_OVERFLOW: int = 20
+    DATABASE_ENGINE_MAX_OVERFLOW: int = 10
     DATABASE_ENGINE_POOL_PING: bool = True
+    # Seconds /health/db waits for SELECT 1 before reporting the database down
+    HEALTH_CHECK_DB_TIMEOUT: float = 0.05
 
     POSTGRES_SERVER: str
     POSTGRES_PORT: int = 5432
@@ -1,3 +1,6 @@
+import os
+import time
+import uuid
 from collections.abc import Generator
 from typing import Annotated
 
@@ -6,11 +9,26 @@ from sqlmodel import Session, SQLModel, create_engine  # noqa: F401
 
 from app.config import settings
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    pool_size=settings.DATABASE_ENGINE_POOL_SIZE,
+    max_overflow=settings.DATABASE_ENGINE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_ENGINE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_ENGINE_POOL_RECYCLE,
+    pool_pre_ping=settings.DATABASE_ENGINE_POOL_PING,
+    # Reuse the most recently returned connection so bursts are served by a
+    # small warm set and idle extras can be recycled
+    pool_use_lifo=True,
+)
+
+# Most rows any list query returns, whatever limit its caller passes
+MAX_PAGE_SIZE = 1000
 
 
 def get_db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
+    # Sessions live for a single request, so there's no need to expire and
+    # reload everything after a commit
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
@@ -19,6 +37,19 @@ DbSession = Annotated[Session, Depends(get_db)]
 NittySQLModel = SQLModel
 
 
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562) for primary keys.
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows land
+    at the right edge of the primary key index instead of on random pages.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 def init_db(session: Session) -> None:
     # Tables should be created with Alembic migrations
     # But if you don't want to use migrations, create
@@ -2,9 +2,10 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Column, Computed, DateTime, Index, Text, func
 from sqlmodel import Field, Relationship
 
-from app.database import NittySQLModel
+from app.database import NittySQLModel, uuid7
 
 if TYPE_CHECKING:
     from app.auth.models import User, UserPublic
@@ -40,15 +41,66 @@ class EventUpdate(NittySQLModel):
 
 
 class Event(EventBase, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    # Fetch server-generated columns with RETURNING on INSERT/UPDATE rather
+    # than expiring them and reloading on the next attribute access
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix_event_active_public_start",
+            "is_active",
+            "is_public",
+            "start_time",
+            "id",
+        ),
+        Index("ix_event_community_start", "community_id", "start_time", "id"),
+        Index("ix_event_creator_start", "created_by", "start_time"),
+        Index("ix_event_start_time_id", "start_time", "id"),
+    )
+
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(), nullable=False, server_default=func.now()),
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(), nullable=False, server_default=func.now(), onupdate=func.now()
+        ),
+    )
     created_by: uuid.UUID = Field(foreign_key="user.id")
     community_id: uuid.UUID = Field(foreign_key="community.id")
-
-    # Relationships
-    creator: "User" = Relationship(back_populates="created_events")
-    community: "Community" = Relationship(back_populates="events")
+    # Searchable text maintained by Postgres, so search_events probes a single
+    # trigram index instead of one per column
+    search_text: Optional[str] = Field(
+        default=None,
+        sa_column=Column(
+            Text,
+            Computed(
+                "coalesce(title, '') || ' ' || coalesce(description, '') || ' ' "
+                "|| coalesce(location, '')",
+                persisted=True,
+            ),
+        ),
+    )
+
+    # Relationships. Loading them lazily raises, so a query that needs them
+    # has to ask for them up front (see get_events(with_details=True)).
+    creator: "User" = Relationship(
+        back_populates="created_events", sa_relationship_kwargs={"lazy": "raise"}
+    )
+    community: "Community" = Relationship(
+        back_populates="events", sa_relationship_kwargs={"lazy": "raise"}
+    )
+
+
+# Trigram index backing the lower(search_text) LIKE predicate in search_events
+Index(
+    "ix_event_search_text_lower_trgm",
+    func.lower(Event.search_text).label("search_text_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text_lower": "gin_trgm_ops"},
+)
 
 
 class EventPublic(EventBase):
@@ -1,27 +1,53 @@
 import logging
 from datetime import datetime
-from typing import Annotated, Any, List, Optional
+from typing import Any, List, NoReturn, Optional, Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import TypeAdapter
 
 import app.events.service as event_service
-from app.auth.models import User
 from app.communities.service import get_community
 from app.database import DbSession
-from app.deps import get_current_user
-from app.events.models import EventCreate, EventPublic, EventUpdate
+from app.deps import CurrentUser
+from app.events.models import Event, EventCreate, EventPublic, EventUpdate
 
 logger = logging.getLogger(__name__)
 
 events_router = APIRouter(tags=["events"])
 
+_events_adapter = TypeAdapter(list[EventPublic])
+
+
+def _list_response(events: Sequence[Event]) -> Response:
+    """Validate and encode a page of events straight to JSON bytes."""
+    public = _events_adapter.validate_python(events, from_attributes=True)
+    return Response(_events_adapter.dump_json(public), media_type="application/json")
+
+
+def _check_keyset(
+    after_start_time: Optional[datetime], after_id: Optional[UUID]
+) -> None:
+    """Reject a keyset cursor that only carries one of its two halves."""
+    if (after_start_time is None) != (after_id is None):
+        raise HTTPException(
+            status_code=400,
+            detail="after_start_time and after_id must be provided together",
+        )
+
+
+def _raise_not_deleted(session: DbSession, event_id: UUID) -> NoReturn:
+    """Explain why a delete scoped to the current user matched no row."""
+    if not event_service.get_event(session=session, event_id=event_id):
+        raise HTTPException(status_code=404, detail="Event not found")
+    raise HTTPException(status_code=403, detail="Not enough permissions")
+
 
 @events_router.post("/", response_model=EventPublic)
 def create_event(
     session: DbSession,
     event_in: EventCreate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: CurrentUser,
 ) -> Any:
     """Create a new event."""
     # Verify the community exists and user has access
@@ -51,8 +77,11 @@ def get_events(
     is_public: Optional[bool] = Query(None),
     is_active: Optional[bool] = Query(None),
     upcoming_only: bool = Query(False),
+    after_start_time: Optional[datetime] = Query(None),
+    after_id: Optional[UUID] = Query(None),
 ) -> Any:
     """Get events with optional filtering."""
+    _check_keyset(after_start_time, after_id)
     events = event_service.get_events(
         session=session,
         skip=skip,
@@ -61,8 +90,10 @@ def get_events(
         is_public=is_public,
         is_active=is_active,
         upcoming_only=upcoming_only,
+        after_start_time=after_start_time,
+        after_id=after_id,
     )
-    return events
+    return _list_response(events)
 
 
 @events_router.get("/search", response_model=List[EventPublic])
@@ -76,7 +107,7 @@ def search_events(
     events = event_service.search_events(
         session=session, query=q, skip=skip, limit=limit
     )
-    return events
+    return _list_response(events)
 
 
 @events_router.get("/upcoming", response_model=List[EventPublic])
@@ -84,16 +115,25 @@ def get_upcoming_events(
     session: DbSession,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_start_time: Optional[datetime] = Query(None),
+    after_id: Optional[UUID] = Query(None),
 ) -> Any:
     """Get upcoming events."""
-    events = event_service.get_upcoming_events(session=session, skip=skip, limit=limit)
-    return events
+    _check_keyset(after_start_time, after_id)
+    events = event_service.get_upcoming_events(
+        session=session,
+        skip=skip,
+        limit=limit,
+        after_start_time=after_start_time,
+        after_id=after_id,
+    )
+    return _list_response(events)
 
 
 @events_router.get("/my", response_model=List[EventPublic])
 def get_my_events(
     session: DbSession,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: CurrentUser,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
 ) -> Any:
@@ -101,7 +141,7 @@ def get_my_events(
     events = event_service.get_events_by_creator(
         session=session, created_by=current_user.id, skip=skip, limit=limit
     )
-    return events
+    return _list_response(events)
 
 
 @events_router.get("/community/{community_id}", response_model=List[EventPublic])
@@ -120,7 +160,7 @@ def get_community_events(
     events = event_service.get_events_by_community(
         session=session, community_id=community_id, skip=skip, limit=limit
     )
-    return events
+    return _list_response(events)
 
 
 @events_router.get("/date-range", response_model=List[EventPublic])
@@ -130,12 +170,15 @@ def get_events_by_date_range(
     end_date: datetime = Query(...),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_start_time: Optional[datetime] = Query(None),
+    after_id: Optional[UUID] = Query(None),
 ) -> Any:
     """Get events within a specific date range."""
     if start_date >= end_date:
         raise HTTPException(
             status_code=400, detail="Start date must be before end date"
         )
+    _check_keyset(after_start_time, after_id)
 
     events = event_service.get_events_by_date_range(
         session=session,
@@ -143,8 +186,10 @@ def get_events_by_date_range(
         end_date=end_date,
         skip=skip,
         limit=limit,
+        after_start_time=after_start_time,
+        after_id=after_id,
     )
-    return events
+    return _list_response(events)
 
 
 @events_router.get("/{event_id}", response_model=EventPublic)
@@ -153,7 +198,7 @@ def get_event(
     event_id: UUID,
 ) -> Any:
     """Get a specific event by ID."""
-    event = event_service.get_event(session=session, event_id=event_id)
+    event = event_service.get_event(session=session, event_id=event_id, use_cache=True)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     return event
@@ -164,7 +209,7 @@ def update_event(
     session: DbSession,
     event_id: UUID,
     event_in: EventUpdate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: CurrentUser,
 ) -> Any:
     """Update an event."""
     event = event_service.get_event(session=session, event_id=event_id)
@@ -185,20 +230,13 @@ def update_event(
 def delete_event(
     session: DbSession,
     event_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: CurrentUser,
 ) -> Any:
     """Delete an event (soft delete)."""
-    event = event_service.get_event(session=session, event_id=event_id)
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-
-    # Check if user is the creator
-    if event.created_by != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-
-    success = event_service.delete_event(session=session, event_id=event_id)
-    if not success:
-        raise HTTPException(status_code=400, detail="Failed to delete event")
+    if not event_service.delete_event(
+        session=session, event_id=event_id, created_by=current_user.id
+    ):
+        _raise_not_deleted(session, event_id)
 
     return {"message": "Event deleted successfully"}
 
@@ -207,21 +245,12 @@ def delete_event(
 def permanently_delete_event(
     session: DbSession,
     event_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: CurrentUser,
 ) -> Any:
     """Permanently delete an event from the database."""
-    event = event_service.get_event(session=session, event_id=event_id)
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-
-    # Check if user is the creator
-    if event.created_by != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-
-    success = event_service.hard_delete_event(session=session, event_id=event_id)
-    if not success:
-        raise HTTPException(
-            status_code=400, detail="Failed to permanently delete event"
-        )
+    if not event_service.hard_delete_event(
+        session=session, event_id=event_id, created_by=current_user.id
+    ):
+        _raise_not_deleted(session, event_id)
 
     return {"message": "Event permanently deleted"}
@@ -1,32 +1,124 @@
 import logging
+import threading
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 from uuid import UUID
 
+from cachetools import TTLCache
+from sqlalchemy import (
+    StatementLambdaElement,
+    bindparam,
+    delete,
+    func,
+    lambda_stmt,
+    tuple_,
+    update,
+)
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
+from app.config import settings
+from app.database import MAX_PAGE_SIZE
 from app.events.models import Event, EventCreate, EventUpdate
 
 logger = logging.getLogger(__name__)
 
+# Per-process caches of event column values for the hottest reads, off unless
+# EVENT_CACHE_TTL is set above 0. They are dropped on every write made through
+# this module; writes from other workers show up once the entries expire.
+# Endpoints run on a thread pool, hence the lock around every access.
+_cache_lock = threading.Lock()
+_event_cache: TTLCache = TTLCache(maxsize=10_000, ttl=settings.EVENT_CACHE_TTL)
+_upcoming_cache: TTLCache = TTLCache(maxsize=1_000, ttl=settings.EVENT_CACHE_TTL)
+# Bumped by every invalidation, so a read that started before a write can tell
+# that the rows it loaded may already be stale
+_cache_generation = 0
+
+
+def _cache_enabled() -> bool:
+    return settings.EVENT_CACHE_TTL > 0
+
+
+def _current_generation() -> int:
+    with _cache_lock:
+        return _cache_generation
+
+
+def _cache_store(cache: TTLCache, key: Any, value: Any, generation: int) -> None:
+    """Cache value unless the caches were invalidated since generation was read."""
+    with _cache_lock:
+        if generation == _cache_generation:
+            cache[key] = value
+
+
+def _invalidate_cache(event_id: Optional[UUID] = None) -> None:
+    """Forget a cached event and every cached upcoming-events page."""
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        if event_id is not None:
+            _event_cache.pop(event_id, None)
+        _upcoming_cache.clear()
+
+
+def _paginate(
+    statement: StatementLambdaElement,
+    *,
+    skip: int,
+    limit: int,
+    after_start_time: Optional[datetime],
+    after_id: Optional[UUID],
+) -> StatementLambdaElement:
+    """Order an event query by (start_time, id) and cut out one page.
+
+    With a keyset (the start_time and id of the last event already seen) the
+    page starts right after that row, so deep pages cost the same as the
+    first one. Otherwise fall back to OFFSET.
+    """
+    if after_start_time is not None and after_id is not None:
+        statement += lambda s: s.where(
+            tuple_(Event.start_time, Event.id) > tuple_(after_start_time, after_id)
+        )
+    else:
+        statement += lambda s: s.offset(skip)
+    statement += lambda s: s.order_by(Event.start_time, Event.id).limit(limit)
+    return statement
+
 
 def create_event(
     *, session: Session, event_create: EventCreate, created_by: UUID
 ) -> Event:
     """Create a new event."""
-    db_obj = Event.model_validate(event_create, update={"created_by": created_by})
+    db_obj = Event(**event_create.model_dump(), created_by=created_by)
     session.add(db_obj)
     session.commit()
-    session.refresh(db_obj)
-    logger.info(f"Created event: {db_obj.id}")
+    _invalidate_cache()
+    logger.info("Created event: %s", db_obj.id)
     return db_obj
 
 
-def get_event(*, session: Session, event_id: UUID) -> Optional[Event]:
-    """Get an event by ID."""
-    statement = select(Event).where(Event.id == event_id)
-    event = session.exec(statement).first()
-    logger.info(f"Retrieved event: {event}")
+def get_event(
+    *, session: Session, event_id: UUID, use_cache: bool = False
+) -> Optional[Event]:
+    """Get an event by ID.
+
+    With ``use_cache=True`` and the cache enabled the result may be a copy up
+    to ``EVENT_CACHE_TTL`` seconds old that isn't attached to ``session``, so
+    only pass it for reads. Updates and deletes must start from a freshly
+    loaded event.
+    """
+    if use_cache and _cache_enabled():
+        with _cache_lock:
+            data = _event_cache.get(event_id)
+        if data is not None:
+            logger.debug("Retrieved event from cache: %s", event_id)
+            return Event(**data)
+
+    generation = _current_generation()
+    event = session.get(Event, event_id)
+    if event is not None and _cache_enabled():
+        _cache_store(_event_cache, event_id, event.model_dump(), generation)
+    logger.debug("Retrieved event: %s", event_id)
     return event
 
 
@@ -39,25 +131,52 @@ def get_events(
     is_public: Optional[bool] = None,
     is_active: Optional[bool] = None,
     upcoming_only: bool = False,
+    with_details: bool = False,
+    after_start_time: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
 ) -> List[Event]:
-    """Get events with optional filtering."""
-    statement = select(Event)
+    """Get events with optional filtering.
+
+    Pass ``with_details=True`` when the creator and community will be read
+    (e.g. for ``EventWithDetails``) so they are batch-loaded up front.
+    ``after_start_time`` and ``after_id`` page by keyset instead of ``skip``.
+    """
+    limit = min(limit, MAX_PAGE_SIZE)
+    statement = lambda_stmt(lambda: select(Event))
+
+    if with_details:
+        statement += lambda s: s.options(
+            selectinload(Event.creator), selectinload(Event.community)
+        )
 
     if community_id is not None:
-        statement = statement.where(Event.community_id == community_id)
+        statement += lambda s: s.where(Event.community_id == community_id)
 
     if is_public is not None:
-        statement = statement.where(Event.is_public == is_public)
+        statement += lambda s: s.where(Event.is_public == is_public)
 
     if is_active is not None:
-        statement = statement.where(Event.is_active == is_active)
+        statement += lambda s: s.where(Event.is_active == is_active)
 
     if upcoming_only:
-        statement = statement.where(Event.start_time >= datetime.now())
-
-    statement = statement.order_by(Event.start_time).offset(skip).limit(limit)
-    events = session.exec(statement).all()
-    logger.info(f"Retrieved {len(events)} events")
+        statement += lambda s: s.where(Event.start_time >= func.now())
+
+    # Each filter combination has an index that yields rows already in
+    # (start_time, id) order, so Postgres can stop after `limit` rows instead
+    # of sorting every match:
+    #   community_id                  -> ix_event_community_start
+    #   is_active and is_public       -> ix_event_active_public_start
+    #   neither                       -> ix_event_start_time_id
+    # Remaining predicates are checked against the rows the scan returns.
+    statement = _paginate(
+        statement,
+        skip=skip,
+        limit=limit,
+        after_start_time=after_start_time,
+        after_id=after_id,
+    )
+    events = session.exec(statement).scalars().all()
+    logger.debug("Retrieved %d events", len(events))
     return events
 
 
@@ -65,10 +184,16 @@ def get_events_by_creator(
     *, session: Session, created_by: UUID, skip: int = 0, limit: int = 100
 ) -> List[Event]:
     """Get events created by a specific user."""
-    statement = select(Event).where(Event.created_by == created_by)
-    statement = statement.order_by(Event.start_time).offset(skip).limit(limit)
-    events = session.exec(statement).all()
-    logger.info(f"Retrieved {len(events)} events for user {created_by}")
+    limit = min(limit, MAX_PAGE_SIZE)
+    statement = lambda_stmt(
+        lambda: select(Event)
+        .where(Event.created_by == created_by)
+        .order_by(Event.start_time)
+        .offset(skip)
+        .limit(limit)
+    )
+    events = session.exec(statement).scalars().all()
+    logger.debug("Retrieved %d events for user %s", len(events), created_by)
     return events
 
 
@@ -76,75 +201,143 @@ def get_events_by_community(
     *, session: Session, community_id: UUID, skip: int = 0, limit: int = 100
 ) -> List[Event]:
     """Get events for a specific community."""
-    statement = select(Event).where(Event.community_id == community_id)
-    statement = statement.order_by(Event.start_time).offset(skip).limit(limit)
-    events = session.exec(statement).all()
-    logger.info(f"Retrieved {len(events)} events for community {community_id}")
+    limit = min(limit, MAX_PAGE_SIZE)
+    statement = lambda_stmt(
+        lambda: select(Event)
+        .where(Event.community_id == community_id)
+        .order_by(Event.start_time)
+        .offset(skip)
+        .limit(limit)
+    )
+    events = session.exec(statement).scalars().all()
+    logger.debug("Retrieved %d events for community %s", len(events), community_id)
     return events
 
 
 def update_event(*, session: Session, db_event: Event, event_in: EventUpdate) -> Event:
     """Update an event."""
     event_data = event_in.model_dump(exclude_unset=True)
-    event_data["updated_at"] = datetime.now()
 
     db_event.sqlmodel_update(event_data)
     session.add(db_event)
     session.commit()
-    session.refresh(db_event)
-    logger.info(f"Updated event: {db_event.id}")
+    _invalidate_cache(db_event.id)
+    logger.info("Updated event: %s", db_event.id)
     return db_event
 
 
-def delete_event(*, session: Session, event_id: UUID) -> bool:
-    """Delete an event (soft delete by setting is_active=False)."""
-    event = get_event(session=session, event_id=event_id)
-    if not event:
-        return False
+def delete_event(*, session: Session, event_id: UUID, created_by: UUID) -> bool:
+    """Delete an event (soft delete by setting is_active=False).
 
-    event.is_active = False
-    event.updated_at = datetime.now()
-    session.add(event)
+    Only touches the event if created_by owns it. Returns False when nothing
+    was deleted: the event doesn't exist or belongs to someone else.
+    """
+    statement = (
+        update(Event)
+        .where(Event.id == event_id, Event.created_by == created_by)
+        .values(is_active=False)
+        .returning(Event.id)
+    )
+    deleted = session.exec(statement).first() is not None
+    session.commit()
+    _invalidate_cache(event_id)
+    if deleted:
+        logger.info("Soft deleted event: %s", event_id)
+    return deleted
+
+
+def hard_delete_event(*, session: Session, event_id: UUID, created_by: UUID) -> bool:
+    """Permanently delete an event from the database.
+
+    Only deletes the event if created_by owns it. Returns False when nothing
+    was deleted.
+    """
+    statement = (
+        delete(Event)
+        .where(Event.id == event_id, Event.created_by == created_by)
+        .returning(Event.id)
+    )
+    deleted = session.exec(statement).first() is not None
     session.commit()
-    logger.info(f"Soft deleted event: {event_id}")
-    return True
+    _invalidate_cache(event_id)
+    if deleted:
+        logger.info("Hard deleted event: %s", event_id)
+    return deleted
 
 
-def hard_delete_event(*, session: Session, event_id: UUID) -> bool:
-    """Permanently delete an event from the database."""
-    event = get_event(session=session, event_id=event_id)
-    if not event:
-        return False
+# Trigram indexes cannot narrow down patterns shorter than three characters
+SEARCH_MIN_LENGTH = 3
 
-    session.delete(event)
-    session.commit()
-    logger.info(f"Hard deleted event: {event_id}")
-    return True
+_search_statement = (
+    select(Event)
+    .where(func.lower(Event.search_text).like(bindparam("pattern"), escape="\\"))
+    .order_by(Event.start_time)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input only ever matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 def search_events(
     *, session: Session, query: str, skip: int = 0, limit: int = 100
 ) -> List[Event]:
-    """Search events by title or description."""
-    statement = select(Event).where(
-        (Event.title.ilike(f"%{query}%"))
-        | (Event.description.ilike(f"%{query}%"))
-        | (Event.location.ilike(f"%{query}%"))
-    )
-    statement = statement.order_by(Event.start_time).offset(skip).limit(limit)
-    events = session.exec(statement).all()
-    logger.info(f"Found {len(events)} events matching query: {query}")
+    """Search events by title, description, or location.
+
+    Queries shorter than ``SEARCH_MIN_LENGTH`` match nothing.
+    """
+    limit = min(limit, MAX_PAGE_SIZE)
+    query = query.strip().lower()
+    if len(query) < SEARCH_MIN_LENGTH:
+        return []
+
+    events = session.exec(
+        _search_statement,
+        params={"pattern": f"%{_escape_like(query)}%", "skip": skip, "limit": limit},
+    ).all()
+    logger.debug("Found %d events matching query: %s", len(events), query)
     return events
 
 
 def get_upcoming_events(
-    *, session: Session, skip: int = 0, limit: int = 100
+    *,
+    session: Session,
+    skip: int = 0,
+    limit: int = 100,
+    after_start_time: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
 ) -> List[Event]:
-    """Get upcoming events (start_time >= now)."""
-    statement = select(Event).where(Event.start_time >= datetime.now())
-    statement = statement.order_by(Event.start_time).offset(skip).limit(limit)
-    events = session.exec(statement).all()
-    logger.info(f"Retrieved {len(events)} upcoming events")
+    """Get upcoming events (start_time >= now).
+
+    With the cache enabled, pages may be served from it as detached copies, so
+    they are only fit for reading.
+    """
+    limit = min(limit, MAX_PAGE_SIZE)
+    key = (skip, limit, after_start_time, after_id)
+    if _cache_enabled():
+        with _cache_lock:
+            rows = _upcoming_cache.get(key)
+        if rows is not None:
+            logger.debug("Retrieved %d upcoming events from cache", len(rows))
+            return [Event(**data) for data in rows]
+    generation = _current_generation()
+
+    statement = lambda_stmt(lambda: select(Event).where(Event.start_time >= func.now()))
+    statement = _paginate(
+        statement,
+        skip=skip,
+        limit=limit,
+        after_start_time=after_start_time,
+        after_id=after_id,
+    )
+    events = session.exec(statement).scalars().all()
+    if _cache_enabled():
+        rows = [event.model_dump() for event in events]
+        _cache_store(_upcoming_cache, key, rows, generation)
+    logger.debug("Retrieved %d upcoming events", len(events))
     return events
 
 
@@ -155,12 +348,25 @@ def get_events_by_date_range(
     end_date: datetime,
     skip: int = 0,
     limit: int = 100,
+    after_start_time: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
 ) -> List[Event]:
     """Get events within a specific date range."""
-    statement = select(Event).where(
-        Event.start_time >= start_date, Event.start_time <= end_date
+    limit = min(limit, MAX_PAGE_SIZE)
+    statement = lambda_stmt(
+        lambda: select(Event).where(
+            Event.start_time >= start_date, Event.start_time <= end_date
+        )
+    )
+    statement = _paginate(
+        statement,
+        skip=skip,
+        limit=limit,
+        after_start_time=after_start_time,
+        after_id=after_id,
+    )
+    events = session.exec(statement).scalars().all()
+    logger.debug(
+        "Retrieved %d events between %s and %s", len(events), start_date, end_date
     )
-    statement = statement.order_by(Event.start_time).offset(skip).limit(limit)
-    events = session.exec(statement).all()
-    logger.info(f"Retrieved {len(events)} events between {start_date} and {end_date}")
     return events
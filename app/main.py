@@ -1,11 +1,14 @@
+import asyncio
 import logging
 
 from fastapi import APIRouter, FastAPI
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 
 from app.auth.router import auth_router
 from app.communities.router import communities_router
 from app.config import settings
-from app.database import DbSession
+from app.database import engine
 from app.events.router import events_router
 
 logging.basicConfig(level=logging.INFO)
@@ -20,6 +23,7 @@ app = FastAPI(
     title="Nitty",
     description="Professional Communities but fun",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -32,21 +36,45 @@ def health_check():
 
 
 @app.get("/health/detailed")
-def detailed_health_check(session: DbSession):
-    """Detailed health check with database connectivity."""
+def detailed_health_check():
+    """Detailed health check with connection pool status.
+
+    Only reads the pool's counters, so it is cheap enough for frequent
+    probes; /health/db is the one that talks to the database.
+    """
+    return {
+        "status": "healthy",
+        "service": "nitty",
+        "database_pool": engine.pool.status(),
+        "version": "0.1.0",
+    }
+
+
+def _ping_database() -> None:
+    with engine.connect() as connection:
+        connection.exec_driver_sql("SELECT 1")
+
+
+@app.get("/health/db")
+async def database_health_check():
+    """Database health check: run SELECT 1 within a short deadline.
+
+    On timeout the ping keeps running in its worker thread, but the probe
+    answers right away instead of hanging on a wedged database.
+    """
     try:
-        # Test database connection
-        session.exec("SELECT 1")
-        return {
-            "status": "healthy",
-            "service": "nitty",
-            "database": "connected",
-            "version": "0.1.0",
-        }
+        await asyncio.wait_for(
+            run_in_threadpool(_ping_database),
+            timeout=settings.HEALTH_CHECK_DB_TIMEOUT,
+        )
     except Exception as e:
-        return {
-            "status": "unhealthy",
-            "service": "nitty",
-            "database": "disconnected",
-            "error": str(e),
-        }
+        return ORJSONResponse(
+            status_code=503,
+            content={
+                "status": "unhealthy",
+                "service": "nitty",
+                "database": "disconnected",
+                "error": str(e) or type(e).__name__,
+            },
+        )
+    return {"status": "healthy", "service": "nitty", "database": "connected"}
@@ -5,8 +5,10 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session, delete
 
 from app.auth.models import User
+from app.communities.models import Community
 from app.config import settings
 from app.database import engine, init_db
+from app.events.models import Event
 from app.main import app
 from app.tests.utils import authentication_token_from_email
 
@@ -16,18 +18,18 @@ def db() -> Generator[Session, None, None]:
     with Session(engine) as session:
         init_db(session)
         yield session
-        statement = delete(User)
-        session.exec(statement)
+        for model in (Event, Community, User):
+            session.exec(delete(model))
         session.commit()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
     with TestClient(app) as c:
         yield c
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]:
     return authentication_token_from_email(
         client=client, email=settings.EMAIL_TEST_USER, db=db
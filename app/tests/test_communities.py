@@ -0,0 +1,27 @@
+import pytest
+from sqlalchemy.orm.exc import DetachedInstanceError
+from sqlmodel import Session
+
+from app.communities import service as community_service
+from app.database import MAX_PAGE_SIZE, engine
+from app.tests.utils import create_random_community
+
+
+def test_get_communities_with_creator_loads_creator(db: Session) -> None:
+    community = create_random_community(db)
+
+    # Read after the session closes, when only an eagerly loaded creator is set
+    with Session(engine) as session:
+        communities = community_service.get_communities(
+            session=session, limit=MAX_PAGE_SIZE, with_creator=True
+        )
+    (loaded,) = [c for c in communities if c.id == community.id]
+    assert loaded.creator.id == community.created_by
+
+    with Session(engine) as session:
+        communities = community_service.get_communities(
+            session=session, limit=MAX_PAGE_SIZE
+        )
+    (plain,) = [c for c in communities if c.id == community.id]
+    with pytest.raises(DetachedInstanceError):
+        plain.creator
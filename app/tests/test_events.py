@@ -0,0 +1,393 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from cachetools import TTLCache
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import Session, delete, update
+
+from app.communities.models import Community
+from app.config import settings
+from app.database import engine
+from app.events import service as event_service
+from app.events.models import Event, EventCreate, EventUpdate
+from app.tests.utils import create_random_community, random_lower_string
+
+
+def _create_event(db: Session, community: Community, start_time: datetime) -> Event:
+    event_in = EventCreate(
+        title=random_lower_string(), start_time=start_time, community_id=community.id
+    )
+    return event_service.create_event(
+        session=db, event_create=event_in, created_by=community.created_by
+    )
+
+
+@pytest.fixture
+def event_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Turn the per-process event caches on, starting empty."""
+    monkeypatch.setattr(settings, "EVENT_CACHE_TTL", 60)
+    monkeypatch.setattr(event_service, "_event_cache", TTLCache(maxsize=100, ttl=60))
+    monkeypatch.setattr(event_service, "_upcoming_cache", TTLCache(maxsize=100, ttl=60))
+
+
+def _change_behind_cache(statement) -> None:
+    """Write straight to the database, like another worker would."""
+    with Session(engine) as session:
+        session.exec(statement)
+        session.commit()
+
+
+def test_get_events_keyset_matches_offset_paging(db: Session) -> None:
+    community = create_random_community(db)
+    start_time = datetime(2030, 1, 1, 9, 0)
+    # Three events per start_time and two per page, so pages split ties
+    for i in range(7):
+        _create_event(db, community, start_time + timedelta(hours=i // 3))
+
+    by_offset = []
+    for skip in range(0, 7, 2):
+        page = event_service.get_events(
+            session=db, community_id=community.id, skip=skip, limit=2
+        )
+        by_offset += [event.id for event in page]
+
+    by_keyset = []
+    page = event_service.get_events(session=db, community_id=community.id, limit=2)
+    while page:
+        by_keyset += [event.id for event in page]
+        page = event_service.get_events(
+            session=db,
+            community_id=community.id,
+            limit=2,
+            after_start_time=page[-1].start_time,
+            after_id=page[-1].id,
+        )
+
+    assert len(set(by_offset)) == 7
+    assert by_keyset == by_offset
+
+
+def test_read_events_by_date_range_keyset(client: TestClient, db: Session) -> None:
+    community = create_random_community(db)
+    start_time = datetime(2031, 6, 1, 9, 0)
+    for _ in range(3):
+        _create_event(db, community, start_time)
+    params = {
+        "start_date": start_time.isoformat(),
+        "end_date": (start_time + timedelta(minutes=1)).isoformat(),
+    }
+
+    r = client.get(f"{settings.API_V1_STR}/events/date-range", params=params)
+    assert r.status_code == 200
+    all_ids = [event["id"] for event in r.json()]
+    assert len(all_ids) == 3
+
+    first = client.get(
+        f"{settings.API_V1_STR}/events/date-range", params={**params, "limit": 1}
+    ).json()
+    rest = client.get(
+        f"{settings.API_V1_STR}/events/date-range",
+        params={
+            **params,
+            "after_start_time": first[0]["start_time"],
+            "after_id": first[0]["id"],
+        },
+    ).json()
+    assert [event["id"] for event in first + rest] == all_ids
+
+
+def test_get_events_with_details_loads_relationships(db: Session) -> None:
+    community = create_random_community(db)
+    _create_event(db, community, datetime.now() + timedelta(days=1))
+
+    with Session(engine) as session:
+        (event,) = event_service.get_events(
+            session=session, community_id=community.id, with_details=True
+        )
+        assert event.creator.id == community.created_by
+        assert event.community.name == community.name
+
+    with Session(engine) as session:
+        (event,) = event_service.get_events(session=session, community_id=community.id)
+        with pytest.raises(InvalidRequestError):
+            event.creator
+
+
+def test_read_events_rejects_half_a_keyset(client: TestClient) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/events/", params={"after_id": str(uuid.uuid4())}
+    )
+    assert r.status_code == 400
+    r = client.get(
+        f"{settings.API_V1_STR}/events/upcoming",
+        params={"after_start_time": "2030-01-01T09:00:00"},
+    )
+    assert r.status_code == 400
+
+
+def test_get_event_cache_is_off_by_default(db: Session) -> None:
+    community = create_random_community(db)
+    event_id = _create_event(db, community, datetime.now() + timedelta(days=1)).id
+    with Session(engine) as session:
+        event_service.get_event(session=session, event_id=event_id, use_cache=True)
+
+    _change_behind_cache(delete(Event).where(Event.id == event_id))
+    with Session(engine) as session:
+        assert (
+            event_service.get_event(session=session, event_id=event_id, use_cache=True)
+            is None
+        )
+
+
+@pytest.mark.usefixtures("event_cache")
+def test_get_event_serves_cache_only_when_asked(db: Session) -> None:
+    community = create_random_community(db)
+    event = _create_event(db, community, datetime.now() + timedelta(days=1))
+    event_id, title = event.id, event.title
+    with Session(engine) as session:
+        event_service.get_event(session=session, event_id=event_id, use_cache=True)
+
+    _change_behind_cache(
+        update(Event).where(Event.id == event_id).values(title="renamed")
+    )
+
+    with Session(engine) as session:
+        cached = event_service.get_event(
+            session=session, event_id=event_id, use_cache=True
+        )
+        assert cached and cached.title == title
+    with Session(engine) as session:
+        fresh = event_service.get_event(session=session, event_id=event_id)
+        assert fresh and fresh.title == "renamed"
+
+
+@pytest.mark.usefixtures("event_cache")
+def test_event_writes_invalidate_cache(db: Session) -> None:
+    community = create_random_community(db)
+    event_id = _create_event(db, community, datetime.now() + timedelta(days=1)).id
+    with Session(engine) as session:
+        event_service.get_event(session=session, event_id=event_id, use_cache=True)
+
+    with Session(engine) as session:
+        db_event = event_service.get_event(session=session, event_id=event_id)
+        assert db_event
+        event_service.update_event(
+            session=session, db_event=db_event, event_in=EventUpdate(title="new")
+        )
+    with Session(engine) as session:
+        cached = event_service.get_event(
+            session=session, event_id=event_id, use_cache=True
+        )
+        assert cached and cached.title == "new"
+
+    with Session(engine) as session:
+        assert event_service.delete_event(
+            session=session, event_id=event_id, created_by=community.created_by
+        )
+    with Session(engine) as session:
+        cached = event_service.get_event(
+            session=session, event_id=event_id, use_cache=True
+        )
+        assert cached and cached.is_active is False
+
+    with Session(engine) as session:
+        assert event_service.hard_delete_event(
+            session=session, event_id=event_id, created_by=community.created_by
+        )
+    with Session(engine) as session:
+        assert (
+            event_service.get_event(session=session, event_id=event_id, use_cache=True)
+            is None
+        )
+
+
+@pytest.mark.usefixtures("event_cache")
+def test_event_writes_clear_upcoming_cache(db: Session) -> None:
+    def upcoming() -> dict[uuid.UUID, str]:
+        with Session(engine) as session:
+            events = event_service.get_upcoming_events(session=session, limit=1000)
+            return {event.id: event.title for event in events}
+
+    community = create_random_community(db)
+    upcoming()
+    event_id = _create_event(db, community, datetime.now() + timedelta(days=1)).id
+    assert event_id in upcoming()
+
+    with Session(engine) as session:
+        db_event = event_service.get_event(session=session, event_id=event_id)
+        assert db_event
+        event_service.update_event(
+            session=session, db_event=db_event, event_in=EventUpdate(title="new")
+        )
+    assert upcoming()[event_id] == "new"
+
+    with Session(engine) as session:
+        event_service.hard_delete_event(
+            session=session, event_id=event_id, created_by=community.created_by
+        )
+    assert event_id not in upcoming()
+
+
+@pytest.mark.usefixtures("event_cache")
+def test_get_event_does_not_cache_a_read_overtaken_by_a_write(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    community = create_random_community(db)
+    event_id = _create_event(db, community, datetime.now() + timedelta(days=1)).id
+
+    with Session(engine) as session:
+
+        def get_then_rename(*args, **kwargs):
+            # The row is loaded, then another thread writes before it is cached
+            event = Session.get(session, *args, **kwargs)
+            with Session(engine) as writer:
+                db_event = event_service.get_event(session=writer, event_id=event_id)
+                assert db_event
+                event_service.update_event(
+                    session=writer, db_event=db_event, event_in=EventUpdate(title="new")
+                )
+            return event
+
+        monkeypatch.setattr(session, "get", get_then_rename)
+        stale = event_service.get_event(
+            session=session, event_id=event_id, use_cache=True
+        )
+        assert stale and stale.title != "new"
+
+    with Session(engine) as session:
+        cached = event_service.get_event(
+            session=session, event_id=event_id, use_cache=True
+        )
+        assert cached and cached.title == "new"
+
+
+@pytest.mark.usefixtures("event_cache")
+def test_update_event_ignores_stale_cache(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.post(
+        f"{settings.API_V1_STR}/communities/",
+        headers=normal_user_token_headers,
+        json={"name": random_lower_string()},
+    )
+    community_id = r.json()["id"]
+    r = client.post(
+        f"{settings.API_V1_STR}/events/",
+        headers=normal_user_token_headers,
+        json={
+            "title": "X",
+            "start_time": (datetime.now() + timedelta(days=1)).isoformat(),
+            "community_id": community_id,
+        },
+    )
+    event_id = uuid.UUID(r.json()["id"])
+    r = client.get(f"{settings.API_V1_STR}/events/{event_id}")
+    assert r.json()["title"] == "X"
+
+    # Another worker renames the event, so this worker's cache is stale
+    _change_behind_cache(update(Event).where(Event.id == event_id).values(title="Y"))
+    r = client.put(
+        f"{settings.API_V1_STR}/events/{event_id}",
+        headers=normal_user_token_headers,
+        json={"title": "X"},
+    )
+    assert r.status_code == 200
+    assert r.json()["title"] == "X"
+    with Session(engine) as session:
+        db_event = session.get(Event, event_id)
+        assert db_event and db_event.title == "X"
+
+    # ...and then deletes it for good
+    _change_behind_cache(delete(Event).where(Event.id == event_id))
+    r = client.put(
+        f"{settings.API_V1_STR}/events/{event_id}",
+        headers=normal_user_token_headers,
+        json={"title": "Z"},
+    )
+    assert r.status_code == 404
+
+
+def test_delete_event_tells_missing_from_not_owned(
+    client: TestClient, normal_user_token_headers: dict[str, str], db: Session
+) -> None:
+    community = create_random_community(db)
+    others = _create_event(db, community, datetime.now() + timedelta(days=1))
+    for path in (f"/events/{others.id}", f"/events/{others.id}/permanent"):
+        r = client.delete(
+            f"{settings.API_V1_STR}{path}", headers=normal_user_token_headers
+        )
+        assert r.status_code == 403
+    with Session(engine) as session:
+        db_event = session.get(Event, others.id)
+        assert db_event and db_event.is_active
+
+    r = client.post(
+        f"{settings.API_V1_STR}/communities/",
+        headers=normal_user_token_headers,
+        json={"name": random_lower_string()},
+    )
+    r = client.post(
+        f"{settings.API_V1_STR}/events/",
+        headers=normal_user_token_headers,
+        json={
+            "title": "X",
+            "start_time": (datetime.now() + timedelta(days=1)).isoformat(),
+            "community_id": r.json()["id"],
+        },
+    )
+    event_id = r.json()["id"]
+    r = client.delete(
+        f"{settings.API_V1_STR}/events/{event_id}/permanent",
+        headers=normal_user_token_headers,
+    )
+    assert r.status_code == 200
+    for path in (f"/events/{event_id}", f"/events/{event_id}/permanent"):
+        r = client.delete(
+            f"{settings.API_V1_STR}{path}", headers=normal_user_token_headers
+        )
+        assert r.status_code == 404
+
+
+def test_escape_like() -> None:
+    assert event_service._escape_like("plain") == "plain"
+    assert event_service._escape_like("100%") == "100\\%"
+    assert event_service._escape_like("a_b") == "a\\_b"
+    assert event_service._escape_like("C:\\path") == "C:\\\\path"
+    assert event_service._escape_like("%_\\") == "\\%\\_\\\\"
+
+
+def test_search_events_matches_wildcards_literally(db: Session) -> None:
+    community = create_random_community(db)
+    start_time = datetime.now() + timedelta(days=1)
+    token = random_lower_string()
+    literal = _create_event(db, community, start_time)
+    literal.title = f"{token} 100% off"
+    lookalike = _create_event(db, community, start_time)
+    lookalike.title = f"{token} 1001 seats"
+    db.add_all([literal, lookalike])
+    db.commit()
+
+    found = {
+        event.id
+        for event in event_service.search_events(session=db, query="00%", limit=1000)
+    }
+    assert literal.id in found
+    assert lookalike.id not in found
+
+    found = {
+        event.id
+        for event in event_service.search_events(
+            session=db, query=f"  {token.upper()}  ", limit=1000
+        )
+    }
+    assert found == {literal.id, lookalike.id}
+
+
+def test_search_events_ignores_short_queries(db: Session) -> None:
+    community = create_random_community(db)
+    event = _create_event(db, community, datetime.now() + timedelta(days=1))
+    query = event.title[:2]
+    assert event_service.search_events(session=db, query=query) == []
+    assert event_service.search_events(session=db, query=f"  {query}  ") == []
@@ -1,9 +1,17 @@
+from datetime import timedelta
+
+import jwt
+import pytest
+from fastapi import HTTPException
 from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.auth import service as auth_service
-from app.auth.models import User, UserCreate, UserUpdate
+from app.auth.models import User, UserCreate, UserRegister, UserUpdate
+from app.auth.router import register_user
 from app.auth.service import verify_password
+from app.config import settings
 from app.tests.utils import random_email, random_lower_string
 
 
@@ -35,6 +43,24 @@ def test_not_authenticate_user(db: Session) -> None:
     assert user is None
 
 
+def test_not_authenticate_unknown_email_verifies_dummy_hash(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[tuple[str, str]] = []
+
+    def fake_verify_password(plain_password: str, hashed_password: str) -> bool:
+        calls.append((plain_password, hashed_password))
+        return False
+
+    monkeypatch.setattr(auth_service, "verify_password", fake_verify_password)
+    password = random_lower_string()
+    user = auth_service.authenticate(
+        session=db, email=random_email(), password=password
+    )
+    assert user is None
+    assert calls == [(password, auth_service._DUMMY_PASSWORD_HASH)]
+
+
 def test_check_if_user_is_active(db: Session) -> None:
     email = random_email()
     password = random_lower_string()
@@ -91,3 +117,39 @@ def test_update_user(db: Session) -> None:
     assert user_2
     assert user.email == user_2.email
     assert verify_password(new_password, user_2.hashed_password)
+
+
+def test_create_access_token() -> None:
+    token = auth_service.create_access_token(
+        "some-subject", expires_delta=timedelta(minutes=5)
+    )
+    assert jwt.get_unverified_header(token) == {
+        "alg": auth_service.ALGORITHM,
+        "typ": "JWT",
+    }
+    payload = jwt.decode(
+        token, settings.SECRET_KEY, algorithms=[auth_service.ALGORITHM]
+    )
+    assert payload["sub"] == "some-subject"
+
+
+def test_register_user_existing_email(client: TestClient) -> None:
+    data = {"email": random_email(), "password": random_lower_string()}
+    r = client.post(f"{settings.API_V1_STR}/signup", json=data)
+    assert r.status_code == 200
+    r = client.post(f"{settings.API_V1_STR}/signup", json=data)
+    assert r.status_code == 400
+    assert r.json()["detail"] == (
+        "The user with this email already exists in the system"
+    )
+
+
+def test_register_user_existing_email_keeps_session_usable(db: Session) -> None:
+    user_in = UserRegister(email=random_email(), password=random_lower_string())
+    register_user(session=db, user_in=user_in)
+    with pytest.raises(HTTPException) as exc_info:
+        register_user(session=db, user_in=user_in)
+    assert exc_info.value.status_code == 400
+    user = auth_service.get_user_by_email(session=db, email=user_in.email)
+    assert user
+    assert user.email == user_in.email
@@ -1,22 +1,40 @@
-import random
-import string
+import secrets
 
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.auth import service as auth_service
-from app.auth.models import UserCreate, UserUpdate
+from app.auth.models import User
+from app.communities import service as community_service
+from app.communities.models import Community, CommunityCreate
 from app.config import settings
 
+# Hashed once per test run, since bcrypt dominates setting up an
+# authenticated user
+_TEST_PASSWORD = "test-password-constant"
+_TEST_PASSWORD_HASH = auth_service.get_password_hash(_TEST_PASSWORD)
+
 
 def random_lower_string() -> str:
-    return "".join(random.choices(string.ascii_lowercase, k=32))
+    return secrets.token_hex(16)
 
 
 def random_email() -> str:
     return f"{random_lower_string()}@{random_lower_string()}.com"
 
 
+def create_random_community(db: Session) -> Community:
+    # The owner never logs in, so reuse the precomputed hash instead of bcrypt
+    user = User(email=random_email(), hashed_password=_TEST_PASSWORD_HASH)
+    db.add(user)
+    db.commit()
+    return community_service.create_community(
+        session=db,
+        community_create=CommunityCreate(name=random_lower_string()),
+        created_by=user.id,
+    )
+
+
 def user_authentication_headers(
     *, client: TestClient, email: str, password: str
 ) -> dict[str, str]:
@@ -35,19 +53,19 @@ def authentication_token_from_email(
     """
     Return a valid token for the user with given email.
 
-    If the user doesn't exist it is created first.
+    If the user doesn't exist it is created first. Its password is set to
+    ``_TEST_PASSWORD`` by storing the precomputed hash directly.
     """
-    password = random_lower_string()
     user = auth_service.get_user_by_email(session=db, email=email)
     if not user:
-        user_in_create = UserCreate(email=email, password=password)
-        user = auth_service.create_user(session=db, user_create=user_in_create)
-    else:
-        user_in_update = UserUpdate(password=password)
-        if not user.id:
-            raise Exception("User id not set")
-        user = auth_service.update_user(
-            session=db, db_user=user, user_in=user_in_update
-        )
-
-    return user_authentication_headers(client=client, email=email, password=password)
+        user = User(email=email, hashed_password=_TEST_PASSWORD_HASH)
+        db.add(user)
+        db.commit()
+    elif user.hashed_password != _TEST_PASSWORD_HASH:
+        user.hashed_password = _TEST_PASSWORD_HASH
+        db.add(user)
+        db.commit()
+
+    return user_authentication_headers(
+        client=client, email=email, password=_TEST_PASSWORD
+    )